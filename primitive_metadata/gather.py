@@ -19,9 +19,10 @@ mindset metaphor:
 from __future__ import annotations
 import dataclasses
 import functools
-import itertools
 import types
-from typing import Union, Iterable, Iterator, Any, Callable, Optional
+from typing import (
+    Union, Iterable, Iterator, Any, Callable, Optional, Literal, overload,
+)
 
 from primitive_metadata import primitive_rdf as rdf
 from primitive_metadata.namespaces import RDF, OWL, RDFS
@@ -70,17 +71,39 @@ class Focus:
             gatherer_kwargset=_gatherer_kwargset,
         )
 
+    def __hash__(self):
+        # leave out gatherer_kwargset (rarely differs; equality still checks
+        # it) -- not cached on the instance, since str hashes differ across
+        # processes (and a cached hash would travel along with a pickle)
+        return hash((self.iris, self.type_iris))
+
     def single_iri(self) -> str:
+        return self._single_iri
+
+    @functools.cached_property
+    def _single_iri(self) -> str:
+        # frozen, so the choice can be made once (cached_property sets
+        # the instance `__dict__` directly, bypassing frozen `__setattr__`)
         return rdf.choose_one_iri(self.iris)
 
-    def as_rdf_tripleset(self) -> Iterator[rdf.RdfTriple]:
+    def as_rdf_tripleset(self) -> tuple[rdf.RdfTriple, ...]:
+        return self._rdf_tripleset
+
+    @functools.cached_property
+    def _rdf_tripleset(self) -> tuple[rdf.RdfTriple, ...]:
         _iri = self.single_iri()
-        for _type_iri in self.type_iris:
-            yield (_iri, RDF.type, _type_iri)
-        for _same_iri in self.iris:
-            if _same_iri != _iri:
-                yield (_iri, OWL.sameAs, _same_iri)
-        # TODO: gatherer_kwargset?
+        return (
+            *(
+                (_iri, RDF.type, _type_iri)
+                for _type_iri in self.type_iris
+            ),
+            *(
+                (_iri, OWL.sameAs, _same_iri)
+                for _same_iri in self.iris
+                if _same_iri != _iri
+            ),
+            # TODO: gatherer_kwargset?
+        )
 
 
 GathererYield = Union[
@@ -152,7 +175,7 @@ class GatheringNorms:
             )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class GatheringOrganizer:
     namestory: rdf.Namestory
     norms: GatheringNorms
@@ -174,11 +197,23 @@ class GatheringOrganizer:
             gatherer_kwargs=(gatherer_kwargs or {}),
         )
 
-    def gatherer(self, *predicate_iris, focustype_iris=None, cache_bound=None):
+    def gatherer(
+        self, *predicate_iris,
+        focustype_iris=None,
+        cache_bound=None,
+        yields_twoples=True,
+    ):
         '''decorate gatherer functions with their iris of interest
+
+        pass `yields_twoples=False` for a gatherer that only yields triples
+        (skips checking the length of each yielded tuple)
         '''
         def _gatherer_decorator(gatherer_fn: Gatherer) -> TripleGatherer:
-            _triple_gatherer = self.__make_triple_gatherer(gatherer_fn)
+            _triple_gatherer = (
+                self.__make_triple_gatherer(gatherer_fn)
+                if yields_twoples
+                else self.__make_tripleonly_gatherer(gatherer_fn)
+            )
             self.signup.add_gatherer(
                 _triple_gatherer,
                 predicate_iris=predicate_iris,
@@ -189,6 +224,10 @@ class GatheringOrganizer:
         return _gatherer_decorator
 
     def validate_gatherer_kwargs(self, gatherer_kwargs):
+        # called for every gatherer call -- compare key views directly
+        # (no new sets) and only build details for the error message
+        if gatherer_kwargs.keys() <= self.gatherer_params.keys():
+            return
         _recognized_keywords = set(self.gatherer_params.keys())
         _unrecognized_kwargs = {
             _keyword: _value
@@ -208,23 +247,44 @@ class GatheringOrganizer:
         @functools.wraps(gatherer_fn)
         def _triple_gatherer(focus: Focus, **gatherer_kwargs):
             self.validate_gatherer_kwargs(gatherer_kwargs)
+            _focus_iri = focus.single_iri()
             for _triple_or_twople in gatherer_fn(focus, **gatherer_kwargs):
                 if len(_triple_or_twople) == 3:
                     (_subj, _pred, _obj) = _triple_or_twople
                 elif len(_triple_or_twople) == 2:
-                    _subj = focus.single_iri()
+                    _subj = _focus_iri
                     (_pred, _obj) = _triple_or_twople
                 else:
                     raise ValueError(
                         f'expected triple or twople (got {_triple_or_twople})',
                     )
-                triple = (_subj, _pred, _obj)
-                if None not in triple:
-                    yield triple
+                if (
+                    _subj is not None
+                    and _pred is not None
+                    and _obj is not None
+                ):
+                    yield (_subj, _pred, _obj)
         return _triple_gatherer
 
+    def __make_tripleonly_gatherer(
+        self,
+        gatherer_fn: Gatherer,
+    ) -> TripleGatherer:
+        @functools.wraps(gatherer_fn)
+        def _tripleonly_gatherer(focus: Focus, **gatherer_kwargs):
+            self.validate_gatherer_kwargs(gatherer_kwargs)
+            for _triple in gatherer_fn(focus, **gatherer_kwargs):
+                (_subj, _pred, _obj) = _triple
+                if (
+                    _subj is not None
+                    and _pred is not None
+                    and _obj is not None
+                ):
+                    yield (_subj, _pred, _obj)
+        return _tripleonly_gatherer
+
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Gathering:
     norms: GatheringNorms
     organizer: GatheringOrganizer
@@ -232,6 +292,12 @@ class Gathering:
     cache: _GatherCache = dataclasses.field(
         default_factory=lambda: _GatherCache(),
     )
+    _kwargs_by_focus: dict[Focus, dict[str, Any]] = dataclasses.field(
+        default_factory=dict,
+        init=False,
+        compare=False,
+        repr=False,
+    )
 
     def ask(
         self, pathset: rdf.MessyPathset, *,
@@ -273,57 +339,108 @@ class Gathering:
             if isinstance(focus, str)
             else focus
         )
-        _predicate_iris = self.organizer.signup.all_predicate_iris()
-        _focus_visited = set()
-        _focus_to_visit = {_asked_focus}
-        while _focus_to_visit:
-            _focus = _focus_to_visit.pop()
-            if _focus not in _focus_visited:
-                _focus_visited.add(_focus)
-                self.ask(_predicate_iris, focus=_focus)
-                _focus_to_visit.update(self.cache.focus_set - _focus_visited)
-
-    def leaf_a_record(self):
-        return types.MappingProxyType(self.cache.gathered.tripledict)
+        # tidy once, and gather directly (results are read via the cache,
+        # so no need for `ask` to peek at each focus)
+        _tidy_pathset = rdf.tidy_pathset(
+            self.organizer.signup.all_predicate_iris(),
+        )
+        self.__gathercache_by_pathset(_tidy_pathset, focus=_asked_focus)
+        # each focus is added to the cache's `_focus_order` exactly once,
+        # so walking that (growing) list visits every focus once -- no need
+        # to compare the whole focus set against visited foci each step
+        _focus_order = self.cache._focus_order
+        _index = 0
+        while _index < len(_focus_order):
+            _focus = _focus_order[_index]
+            _index += 1
+            if _focus != _asked_focus:
+                self.__gathercache_by_pathset(_tidy_pathset, focus=_focus)
+
+    @overload
+    def leaf_a_record(
+        self, *, pls_copy: Literal[False] = False,
+    ) -> rdf.ReadonlyTripleDictionary: ...
+
+    @overload
+    def leaf_a_record(
+        self, *, pls_copy: Literal[True],
+    ) -> rdf.RdfTripleDictionary: ...
+
+    def leaf_a_record(self, *, pls_copy=False):
+        _tripledict = self.cache.gathered.tripledict
+        if pls_copy:
+            # copy the two dict levels and the object sets; the objects are
+            # shared (iris, literals, and frozensets are immutable, but any
+            # QuotedGraph object is not)
+            return {
+                _subj: {
+                    _pred: set(_objs)
+                    for _pred, _objs in _twopledict.items()
+                }
+                for _subj, _twopledict in _tripledict.items()
+            }
+        return types.MappingProxyType(_tripledict)
 
     def __gathercache_by_pathset(
         self, pathset: rdf.TidyPathset, *, focus: Focus
     ) -> None:
         '''gather information into the cache (unless already gathered)
         '''
-        self.__gathercache_predicate_iris(focus, set(pathset.keys()))
-        for _pred, _next_pathset in pathset.items():
-            if _next_pathset:
-                for _obj in self.cache.peek(_pred, focus=focus):
-                    # indirect recursion:
-                    self.__gathercache_thru_object(_next_pathset, _obj)
-
-    def __gathercache_thru_object(
-        self,
-        pathset: rdf.TidyPathset,
-        obj: rdf.RdfObject,
-    ) -> None:
-        if isinstance(obj, str):  # iri
-            try:
-                _next_focus = self.cache.get_focus_by_iri(obj)
-            except GatherException:
-                return  # not a usable focus
-            else:
-                self.__gathercache_by_pathset(pathset, focus=_next_focus)
-        elif isinstance(obj, frozenset):  # blank node
-            if rdf.is_container(obj):  # pass thru rdf containers transparently
-                for _container_obj in rdf.container_objects(obj):
-                    self.__gathercache_thru_object(
-                        pathset, _container_obj
+        # walk with an explicit stack instead of recursion, so deep paths
+        # cost no python frames (and can't hit the recursion limit) -- items
+        # are pushed in reverse, so they pop in the order recursion would
+        # visit them; an item with a predicate means "read that predicate's
+        # objects from the focus iri now", deferred until everything before
+        # it was gathered (which may have added objects to read)
+        _to_visit: list[tuple[
+            rdf.TidyPathset,
+            Focus | rdf.RdfObject,
+            str | None,
+        ]] = [
+            (pathset, focus, None),
+        ]
+        while _to_visit:
+            _pathset, _focus_or_obj, _pred_to_read = _to_visit.pop()
+            if _pred_to_read is not None:  # (_focus_or_obj is a focus iri)
+                _to_visit.extend(
+                    (_pathset, _obj, None)
+                    for _obj in reversed(tuple(self.cache.peek_by_iri(
+                        _focus_or_obj,
+                        _pred_to_read,
+                    )))
+                )
+            elif isinstance(_focus_or_obj, Focus):
+                self.__gathercache_predicate_iris(
+                    _focus_or_obj,
+                    set(_pathset.keys()),
+                )
+                _focus_iri = _focus_or_obj.single_iri()
+                _to_visit.extend(
+                    (_next_pathset, _focus_iri, _pred)
+                    for _pred, _next_pathset in reversed(_pathset.items())
+                    if _next_pathset
+                )
+            elif isinstance(_focus_or_obj, str):  # iri
+                try:
+                    _next_focus = self.cache.get_focus_by_iri(_focus_or_obj)
+                except GatherException:
+                    continue  # not a usable focus
+                _to_visit.append((_pathset, _next_focus, None))
+            elif isinstance(_focus_or_obj, frozenset):  # blank node
+                if rdf.is_container(_focus_or_obj):
+                    # pass thru rdf containers transparently
+                    _to_visit.extend(
+                        (_pathset, _container_obj, None)
+                        for _container_obj in reversed(tuple(
+                            rdf.container_objects(_focus_or_obj),
+                        ))
                     )
-            else:  # not a container
-                for _pred, _obj in obj:
-                    _next_pathset = pathset.get(_pred)
-                    if _next_pathset:
-                        self.__gathercache_thru_object(
-                            _next_pathset, _obj
-                        )
-        # otherwise, ignore
+                else:  # not a container
+                    for _pred, _obj in reversed(tuple(_focus_or_obj)):
+                        _next_pathset = _pathset.get(_pred)
+                        if _next_pathset:
+                            _to_visit.append((_next_pathset, _obj, None))
+            # otherwise, ignore
 
     def __gathercache_predicate_iris(
         self,
@@ -332,9 +449,11 @@ class Gathering:
     ) -> None:
         self.cache.add_focus(focus)
         _signup = self.organizer.signup
-        for gatherer in _signup.get_gatherers(focus, predicate_iris):
-            if self.cache.already_gathered(gatherer, focus):
-                continue
+        _gatherers = self.cache.not_yet_gathered(
+            _signup.get_gatherers(focus, predicate_iris),
+            focus,
+        )
+        for gatherer in _gatherers:
             _bound = _signup._cache_bounds.get(gatherer)
             _triples = (
                 self.__do_unbounded_gather(gatherer, focus)
@@ -372,30 +491,67 @@ class Gathering:
                     break
 
     def __gatherer_kwargs(self, gatherer, focus) -> dict:
-        return {
-            **self.organizer.default_gatherer_kwargs,
-            **self.gatherer_kwargs,
-            **dict(focus.gatherer_kwargset),
-        }
+        # merged once per focus -- safe to share, since each call site
+        # unpacks it into a fresh dict (`gatherer(focus, **kwargs)`)
+        try:
+            return self._kwargs_by_focus[focus]
+        except KeyError:
+            _kwargs = self._kwargs_by_focus[focus] = {
+                **self.organizer.default_gatherer_kwargs,
+                **self.gatherer_kwargs,
+                **dict(focus.gatherer_kwargset),
+            }
+            return _kwargs
 
 
 class _GatherCache:
-    gathers_done: set[tuple[Gatherer, Focus]]
+    __slots__ = (
+        'gathers_done',
+        'focus_set',
+        '_focus_order',
+        '_focus_by_iri',
+        'gathered',
+    )
+    gathers_done: dict[Focus, set[Gatherer]]
     focus_set: set[Focus]
+    _focus_order: list[Focus]  # same as focus_set, in order added
+    _focus_by_iri: dict[str, Focus]  # built by get_focus_by_iri
     gathered: rdf.RdfGraph
 
     def __init__(self):
-        self.gathers_done = set()
+        self.gathers_done = {}
         self.focus_set = set()
+        self._focus_order = []
+        self._focus_by_iri = {}
         self.gathered = rdf.RdfGraph()
 
     def add_focus(self, focus: Focus):
-        if focus not in self.focus_set:
-            self.focus_set.add(focus)
+        if focus in self.focus_set:
+            return
+        self.focus_set.add(focus)
+        self._focus_order.append(focus)
+        # a focus built for this iri holds all the graph has for it; if it
+        # covers the new focus, the graph (and that built focus) stand
+        _known = self._focus_by_iri.get(focus.single_iri())
+        _already_in_graph = (
+            _known is not None
+            and focus.iris <= _known.iris
+            and focus.type_iris <= _known.type_iris
+        )
+        if not _already_in_graph:  # skip re-adding the same triples
+            # new triples may change the focus built for any of these iris
+            for _iri in focus.iris:
+                self._focus_by_iri.pop(_iri, None)
             for triple in focus.as_rdf_tripleset():
                 self.gathered.add(triple)
 
     def get_focus_by_iri(self, iri: str):
+        # only foci built here (from everything the graph holds for the
+        # iri) are kept, and are dropped when that may have changed
+        try:
+            return self._focus_by_iri[iri]
+        except KeyError:
+            pass
         _type_iris = frozenset(self.gathered.q(iri, RDF.type))
         if not _type_iris:
             raise GatherException(
@@ -406,12 +562,16 @@ class _GatherCache:
         _iris = {iri, *_same_iris}
         _focus = Focus.new(iris=_iris, type_iris=_type_iris)
         self.add_focus(_focus)
+        self._focus_by_iri[iri] = _focus
         return _focus
 
     def add_triple(self, triple: rdf.RdfTriple):
         (_subj, _pred, _obj) = triple
         _subj = self.__maybe_unwrap_focus(_subj)
         _obj = self.__maybe_unwrap_focus(_obj)
+        if _pred == RDF.type or _pred == OWL.sameAs:
+            # new type or synonym may change the focus for this iri
+            self._focus_by_iri.pop(_subj, None)
         self.gathered.add((_subj, _pred, _obj))
 
     def peek(
@@ -430,15 +590,36 @@ class _GatherCache:
             )
         yield from self.gathered.q(_focus_iri, pathset)
 
-    def already_gathered(
-        self, gatherer: Gatherer, focus: Focus, *,
-        pls_mark_done=True,
-    ) -> bool:
-        gatherkey = (gatherer, focus)
-        is_done = (gatherkey in self.gathers_done)
-        if pls_mark_done and not is_done:
-            self.gathers_done.add(gatherkey)
-        return is_done
+    def peek_by_iri(
+        self, focus_iri: str, predicate_iri: str,
+    ) -> Iterable[rdf.RdfObject]:
+        '''peek one step: objects of the given predicate from the given iri
+
+        (a lighter `peek`, for callers with an iri and a lone predicate
+        already in hand -- do not modify the returned collection)
+        '''
+        _twopledict = self.gathered.tripledict.get(focus_iri)
+        return (_twopledict.get(predicate_iri) or ()) if _twopledict else ()
+
+    def not_yet_gathered(
+        self, gatherers: frozenset[Gatherer], focus: Focus,
+    ) -> frozenset[Gatherer]:
+        '''of the given gatherers, those not yet gathered for the focus
+
+        (marks those as gathered, since the caller is about to gather them)
+        '''
+        _done = self.gathers_done.get(focus)
+        _not_done = (
+            gatherers
+            if _done is None
+            else gatherers.difference(_done)
+        )
+        if _not_done:
+            if _done is None:
+                self.gathers_done[focus] = set(_not_done)
+            else:
+                _done.update(_not_done)
+        return _not_done
 
     def __maybe_unwrap_focus(
         self,
@@ -452,26 +633,64 @@ class _GatherCache:
 
 if __debug__:
     class TestGatherCache(unittest.TestCase):
-        pass  # TODO
+        def test_add_focus_same_iri(self):
+            _wide = Focus.new(
+                {BLARG.a, BLARG.b},
+                type_iris={BLARG.SomeType, BLARG.AnotherType},
+            )
+            _narrow = Focus.new(BLARG.a, type_iris=BLARG.SomeType)
+            _wide_only = _GatherCache()
+            _wide_only.add_focus(_wide)
+            _cache = _GatherCache()
+            _cache.add_focus(_wide)
+            _found = _cache.get_focus_by_iri(BLARG.a)
+            self.assertEqual(_found, _wide)
+            _cache.add_focus(_narrow)
+            self.assertEqual(_cache._focus_order, [_wide, _narrow])
+            # lookup by iri still gives the widest focus the graph supports
+            self.assertIs(_cache.get_focus_by_iri(BLARG.a), _found)
+            self.assertEqual(
+                _cache.gathered.tripledict,
+                _wide_only.gathered.tripledict,
+            )
+            # in either order
+            _cache = _GatherCache()
+            _cache.add_focus(_narrow)
+            _cache.add_focus(_wide)
+            self.assertEqual(_cache.get_focus_by_iri(BLARG.a), _wide)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class _GathererSignup:
-    _by_predicate: dict[str, set[TripleGatherer]] = dataclasses.field(
+    # registration happens once (at decoration time) while reads happen for
+    # every gather, so hold frozensets (rebuilt on add) that may be shared
+    _by_predicate: dict[str, frozenset[TripleGatherer]] = dataclasses.field(
         default_factory=dict,
     )
-    _by_focustype: dict[str, set[TripleGatherer]] = dataclasses.field(
+    _by_focustype: dict[str, frozenset[TripleGatherer]] = dataclasses.field(
         default_factory=dict,
     )
-    _for_any_predicate: set[TripleGatherer] = dataclasses.field(
-        default_factory=set,
-    )
-    _for_any_focustype: set[TripleGatherer] = dataclasses.field(
-        default_factory=set,
-    )
+    _for_any_predicate: frozenset[TripleGatherer] = frozenset()
+    _for_any_focustype: frozenset[TripleGatherer] = frozenset()
     _cache_bounds: dict[TripleGatherer, int] = dataclasses.field(
         default_factory=dict,
     )
+    # get_gatherers results by (focus.type_iris, predicate_iris)
+    _gatherers_cache: dict[
+        tuple[frozenset[str], frozenset[str]],
+        frozenset[TripleGatherer],
+    ] = dataclasses.field(
+        default_factory=dict,
+        init=False,
+        compare=False,
+        repr=False,
+    )
+    _all_predicate_iris: frozenset[str] | None = dataclasses.field(
+        default=None,
+        init=False,
+        compare=False,
+        repr=False,
+    )
 
     def add_gatherer(
         self, gatherer: TripleGatherer, *,
@@ -479,53 +698,57 @@ class _GathererSignup:
         focustype_iris,
         cache_bound: int | None = None,
     ):
+        # any cached result may now be wrong
+        self._gatherers_cache.clear()
+        self._all_predicate_iris = None
         if cache_bound is not None:
             self._cache_bounds[gatherer] = cache_bound
         if predicate_iris:
             for iri in predicate_iris:
-                (
-                    self._by_predicate
-                    .setdefault(iri, set())
-                    .add(gatherer)
+                self._by_predicate[iri] = (
+                    self._by_predicate.get(iri, frozenset())
+                    | {gatherer}
                 )
         else:
-            self._for_any_predicate.add(gatherer)
+            self._for_any_predicate |= {gatherer}
         if focustype_iris:
             for iri in focustype_iris:
-                (
-                    self._by_focustype
-                    .setdefault(iri, set())
-                    .add(gatherer)
+                self._by_focustype[iri] = (
+                    self._by_focustype.get(iri, frozenset())
+                    | {gatherer}
                 )
         else:
-            self._for_any_focustype.add(gatherer)
+            self._for_any_focustype |= {gatherer}
         return gatherer
 
     def all_predicate_iris(self):
-        return frozenset(self._by_predicate.keys())
+        if self._all_predicate_iris is None:
+            self._all_predicate_iris = frozenset(self._by_predicate.keys())
+        return self._all_predicate_iris
 
     def get_gatherers(
         self,
         focus: Focus,
         predicate_iris: Iterable[str],
-    ) -> set[TripleGatherer]:
-        gatherer_set = None
-        for iris, gatherers_by_iri, gatherers_for_any_iri in (
-            (predicate_iris, self._by_predicate, self._for_any_predicate),
-            (focus.type_iris, self._by_focustype, self._for_any_focustype),
-        ):
-            gatherer_iter = itertools.chain(
-                *(
-                    gatherers_by_iri.get(iri, frozenset())
-                    for iri in iris
-                ),
-                gatherers_for_any_iri,
-            )
-            if gatherer_set is None:
-                gatherer_set = set(gatherer_iter)
-            else:
-                gatherer_set.intersection_update(gatherer_iter)
-        return gatherer_set or set()
+    ) -> frozenset[TripleGatherer]:
+        _predicate_iris = frozenset(predicate_iris)
+        _cachekey = (focus.type_iris, _predicate_iris)
+        try:
+            return self._gatherers_cache[_cachekey]
+        except KeyError:
+            pass
+        _by_predicate = set().union(
+            *(self._by_predicate.get(_iri, ()) for _iri in _predicate_iris),
+            self._for_any_predicate,
+        )
+        _by_focustype = set().union(
+            *(self._by_focustype.get(_iri, ()) for _iri in focus.type_iris),
+            self._for_any_focustype,
+        )
+        _gatherers = self._gatherers_cache[_cachekey] = frozenset(
+            _by_predicate & _by_focustype,
+        )
+        return _gatherers
 
 
 if __debug__:
@@ -674,12 +897,139 @@ if __debug__:
                 {_a_blargfocus.single_iri()},
             )
 
+        def test_ask_nested_pathset(self):
+            blargAthering = BlorgArganizer.new_gathering({
+                'hello': 'hehe',
+            })
+            self.assertEqual(
+                set(blargAthering.ask(
+                    {BLARG.yoo: {BLARG.yoo: {BLARG.number}}},
+                    focus=_a_blargfocus,
+                )),
+                {1},  # back to the starting focus
+            )
+            self.assertEqual(
+                set(blargAthering.ask(
+                    {BLARG.yoo: {BLARG.yoo: BLARG.number}},
+                    focus=_nother_blargfocus,
+                )),
+                set(),  # only _a_blargfocus has a number
+            )
+            self.assertEqual(
+                set(blargAthering.ask(
+                    {BLARG.yoo: {BLARG.greeting, BLARG.number}},
+                    focus=_a_blargfocus,
+                )),
+                {
+                    rdf.literal('kia ora', language='mi'),
+                    rdf.literal('hola', language='es'),
+                    rdf.literal('hello', language='en'),
+                    rdf.literal('hehe', language=BLARG.Dunno),
+                },
+            )
+
+        def test_tripleonly_gatherer(self):
+            _organizer = GatheringOrganizer(
+                namestory=(),
+                norms=BlargAtheringNorms,
+                gatherer_params={},
+            )
+
+            @_organizer.gatherer(BLARG.greeting, yields_twoples=False)
+            def _tripleonly(focus: Focus):
+                _iri = focus.single_iri()
+                yield (_iri, BLARG.greeting, rdf.literal('yo'))
+                yield (_iri, BLARG.greeting, None)  # discarded
+                yield [_iri, BLARG.greeting, rdf.literal('sup')]
+                yield (_nother_blargfocus, BLARG.yoo, focus)
+
+            # triples come out as tuples, however they were yielded
+            # (same as from a gatherer that may yield twoples)
+            self.assertEqual(
+                {type(_triple) for _triple in _tripleonly(_a_blargfocus)},
+                {tuple},
+            )
+            _gathering = _organizer.new_gathering()
+            self.assertEqual(
+                set(_gathering.ask(BLARG.greeting, focus=_a_blargfocus)),
+                {rdf.literal('yo'), rdf.literal('sup')},
+            )
+            self.assertEqual(
+                set(_gathering.ask(BLARG.yoo, focus=_nother_blargfocus)),
+                {_a_blargfocus.single_iri()},
+            )
+
+        def test_ask_follows_incidental_triples(self):
+            _organizer = GatheringOrganizer(
+                namestory=(),
+                norms=BlargAtheringNorms,
+                gatherer_params={},
+            )
+            _a = Focus.new(BLARG.a, type_iris=BLARG.SomeType)
+            _c = Focus.new(BLARG.c, type_iris=BLARG.SomeType)
+
+            @_organizer.gatherer(BLARG.p1)
+            def _gather_p1(focus: Focus):
+                if focus == _a_blargfocus:
+                    yield (BLARG.p1, _a)
+
+            @_organizer.gatherer(BLARG.q)
+            def _gather_q(focus: Focus):
+                if focus == _a:
+                    yield (BLARG.q, 'a')
+                    # incidental triple about an earlier focus
+                    yield (_a_blargfocus, BLARG.p2, _c)
+                elif focus == _c:
+                    yield (BLARG.q, 'c')
+
+            _gathering = _organizer.new_gathering()
+            self.assertEqual(
+                set(_gathering.ask(
+                    {BLARG.p1: BLARG.q, BLARG.p2: BLARG.q},
+                    focus=_a_blargfocus,
+                )),
+                {'a', 'c'},
+            )
+
+        def test_focus_by_iri_has_all_types(self):
+            _organizer = GatheringOrganizer(
+                namestory=(),
+                norms=BlargAtheringNorms,
+                gatherer_params={},
+            )
+            _wide = Focus.new(
+                BLARG.c,
+                type_iris={BLARG.SomeType, BLARG.AnotherType},
+            )
+            _narrow = Focus.new(BLARG.c, type_iris=BLARG.SomeType)
+
+            @_organizer.gatherer(BLARG.yoo, BLARG.number)
+            def _gather_yoo(focus: Focus):
+                yield (BLARG.yoo, _wide)
+                yield (BLARG.number, _narrow)
+
+            @_organizer.gatherer(
+                BLARG.greeting,
+                focustype_iris={BLARG.AnotherType},
+            )
+            def _gather_another_greeting(focus: Focus):
+                yield (BLARG.greeting, rdf.literal('from AnotherType'))
+
+            _gathering = _organizer.new_gathering()
+            self.assertEqual(
+                list(_gathering.ask(
+                    {BLARG.yoo: BLARG.greeting},
+                    focus=_a_blargfocus,
+                )),
+                [rdf.literal('from AnotherType')],
+            )
+
         def test_ask_all_about(self):
             blargAthering = BlorgArganizer.new_gathering({
                 'hello': 'hoohoo',
             })
             blargAthering.ask_all_about(_a_blargfocus)
-            _tripledict = blargAthering.leaf_a_record().copy()
+            _tripledict = blargAthering.leaf_a_record(pls_copy=True)
             self.assertEqual(_tripledict, {
                 _a_blargfocus.single_iri(): {
                     RDF.type: {BLARG.SomeType},
@@ -707,6 +1057,13 @@ if __debug__:
                     BLARG.incidentalProp: {0, 1, 4},  # only 3 objects
                 },
             })
+            # the copy is isolated from the gathering's own record
+            _tripledict[_a_blargfocus.single_iri()][BLARG.number].add(7)
+            self.assertEqual(
+                blargAthering.leaf_a_record()[
+                    _a_blargfocus.single_iri()][BLARG.number],
+                {1},
+            )
 
         def test_ask_streaming(self):
             blargAthering = BlorgArganizer.new_gathering({
@@ -11,6 +11,7 @@ import functools  # using functools.cache: python3.9+
 import json
 import logging
 import operator
+import sys
 import types
 from typing import Iterable, Iterator, Union, Optional, NamedTuple, Callable
 import weakref
@@ -46,9 +47,15 @@ ReadonlyTwopleDictionary = collections.abc.Mapping[
     RdfPredicate,
     collections.abc.Collection[RdfObject],
 ]
+ReadonlyTripleDictionary = collections.abc.Mapping[
+    RdfSubject,
+    ReadonlyTwopleDictionary,
+]
 
 # for defining branching paths of predicates from a focus
 TidyPathset = dict[RdfPredicate, 'TidyPathset']
+# (or compiled to immutable nested tuples, for repeated queries)
+CompiledPathset = tuple[tuple[RdfPredicate, 'CompiledPathset'], ...]
 # (tho be flexible in public api: allow messier pathsets)
 MessyPathset = Union[
     dict[RdfPredicate, 'MessyPathset'],
@@ -78,6 +85,9 @@ def tripledict_from_tripleset(tripleset: Iterable[RdfTriple]):
     return _tripledict
 
 
+_EMPTY_FROZENSET: frozenset = frozenset()
+
+
 def ensure_frozenset(something) -> frozenset:
     '''convenience for building frozensets
 
@@ -103,12 +113,17 @@ def ensure_frozenset(something) -> frozenset:
     >>> ensure_frozenset(_r) is _r
     True
     '''
+    _type = type(something)  # exact-type checks first, for the common cases
+    if _type is frozenset:
+        return something
+    if _type is str:
+        return frozenset((something,))
+    if something is None:
+        return _EMPTY_FROZENSET
     if isinstance(something, frozenset):
         return something
     if isinstance(something, str):
-        return frozenset({something})
-    if something is None:
-        return frozenset()
+        return frozenset((something,))
     try:  # maybe iterable?
         return frozenset(something)
     except TypeError:
@@ -178,10 +193,10 @@ def twopledict_from_twopleset(
     True
     '''
     _twopledict: RdfTwopleDictionary = {}
+    _get_objectset = _twopledict.get  # bound once, not per twople
     for _pred, _obj in twopleset:
-        if _pred in _twopledict:
-            _objectset = _twopledict[_pred]
-        else:
+        _objectset = _get_objectset(_pred)
+        if _objectset is None:
             _objectset = _twopledict[_pred] = set()
         _objectset.add(_obj)
     return _twopledict
@@ -193,15 +208,8 @@ def smells_like_iri(something) -> bool:
 
 def smells_like_rdf_object(something) -> bool:
     return (
-        isinstance(something, (
-            int,
-            float,
-            datetime.date,
-            Literal,
-            QuotedTriple,
-            QuotedGraph,
-        ))
-        or smells_like_iri(something)
+        smells_like_iri(something)  # most common, so check first
+        or isinstance(something, _NONIRI_RDF_OBJECT_TYPES)
         or smells_like_blanknode(something)
     )
 
@@ -257,21 +265,17 @@ def smells_like_rdf_tripledict(rdf_dictionary) -> bool:
     >>> smells_like_rdf_tripledict({RDF.type: {7: {RDF.Property}}})
     False
     '''
-    if not isinstance(rdf_dictionary, dict):
-        return False
-    for _subj, _twopledict in rdf_dictionary.items():
-        if not _subj or not isinstance(_subj, str):
-            return False
-        if not _twopledict or not isinstance(_twopledict, dict):
-            return False
-        for _pred, _objectset in _twopledict.items():
-            if not _pred or not isinstance(_pred, str):
-                return False
-            if not _objectset or not isinstance(_objectset, set):
-                return False
-            if not all(smells_like_rdf_object(_obj) for _obj in _objectset):
-                return False
-    return True
+    return isinstance(rdf_dictionary, dict) and all(
+        _subj and isinstance(_subj, str)
+        and _twopledict and isinstance(_twopledict, dict)
+        and all(
+            _pred and isinstance(_pred, str)
+            and _objectset and isinstance(_objectset, set)
+            and all(map(smells_like_rdf_object, _objectset))
+            for _pred, _objectset in _twopledict.items()
+        )
+        for _subj, _twopledict in rdf_dictionary.items()
+    )
 
 
 def iter_tripleset(
@@ -327,16 +331,16 @@ class Literal(NamedTuple):
 
     @property
     def language(self) -> Optional[str]:
-        try:
-            return next(self.iter_language_tags())
-        except StopIteration:
-            return None
+        for _iri in self.datatype_iris:
+            if _iri.startswith(_IANA_LANGUAGE_IRI):
+                return _iri[_IANA_LANGUAGE_IRI_LEN:]
+        return None
 
     def iter_language_tags(self) -> Iterator[str]:
         yield from (
-            iri_minus_namespace(_iri, namespace=IANA_LANGUAGE)
+            _iri[_IANA_LANGUAGE_IRI_LEN:]
             for _iri in self.datatype_iris
-            if _iri in IANA_LANGUAGE
+            if _iri.startswith(_IANA_LANGUAGE_IRI)
         )
 
     def single_datatype(self) -> str:
@@ -418,16 +422,16 @@ def literal(
 
     if _str_value is None:
         raise ValueError(f'expected RdfObject, got {primitive_value}')
-
-    def _iter_one_or_many(items) -> Iterator:
-        if isinstance(items, str):
-            yield items
-        else:
-            try:
-                for _item in items:
-                    yield from _iter_one_or_many(_item)
-            except TypeError:
-                pass  # not str or iterable; ignore
+    if (
+        datatype_iris == ()
+        and language is None
+        and mediatype is None
+        and _implied_datatype is not None
+    ):  # common case: only the implied datatype, in a shared frozenset
+        return Literal(
+            unicode_value=_str_value,
+            datatype_iris=_IMPLIED_DATATYPE_IRIS[_implied_datatype],
+        )
 
     def _iter_datatype_iris() -> Iterator[str]:
         yield from _iter_one_or_many(datatype_iris)
@@ -447,6 +451,27 @@ def literal(
     )
 
 
+def _iter_one_or_many(items) -> Iterator[str]:
+    '''flatten a str or (arbitrarily nested) iterable of str
+
+    >>> list(_iter_one_or_many('a'))
+    ['a']
+    >>> list(_iter_one_or_many(['a', ['b', ('c',)], None, 7, 'd']))
+    ['a', 'b', 'c', 'd']
+    '''
+    # walk with an explicit stack (not recursive generators)
+    _to_visit = [items]
+    while _to_visit:
+        _item = _to_visit.pop()
+        if isinstance(_item, str):
+            yield _item
+        else:
+            try:
+                _to_visit.extend(reversed(tuple(_item)))  # keep order
+            except TypeError:
+                pass  # not str or iterable; ignore
+
+
 def literal_or_none(
     primitive_value: Union[str, int, float, datetime.date, None], **kwargs
 ) -> Union[Literal, None]:
@@ -520,10 +545,7 @@ def is_container(bnode: RdfBlanknode) -> bool:
     >>> is_container(blanknode())
     False
     '''
-    return any(
-        (RDF.type, _container_type) in bnode
-        for _container_type in (RDF.Seq, RDF.Bag, RDF.Alt, RDF.Container)
-    )
+    return not bnode.isdisjoint(_CONTAINER_TYPE_TWOPLES)
 
 
 def sequence(
@@ -547,11 +569,28 @@ def sequence_objects_in_order(seq: RdfBlanknode) -> Iterator[RdfObject]:
     >>> _seq = sequence([5,4,3,2,1])
     >>> list(sequence_objects_in_order(_seq))
     [5, 4, 3, 2, 1]
+    >>> _sparse = blanknode({RDF.type: {RDF.Seq}, RDF._7: {7}, RDF._2: {2}})
+    >>> list(sequence_objects_in_order(_sparse))
+    [2, 7]
     '''
     assert (RDF.type, RDF.Seq) in seq
+    _indexed = list(_enumerate_container(seq))
+    # sequences are usually dense (rdf:_1 thru rdf:_n), so place each
+    # object at its index directly -- sort only if that doesn't fit
+    _in_order: list = [None] * len(_indexed)
+    for _index, _obj in _indexed:
+        _position = _index - 1
+        if not (0 <= _position < len(_in_order)):
+            break
+        if _in_order[_position] is not None:  # repeated index
+            break
+        _in_order[_position] = _obj
+    else:  # dense
+        yield from _in_order
+        return
     yield from map(
         operator.itemgetter(1),
-        sorted(_enumerate_container(seq), key=operator.itemgetter(0)),
+        sorted(_indexed, key=operator.itemgetter(0)),
     )
 
 
@@ -573,17 +612,14 @@ def container_objects(bnode: RdfBlanknode) -> Iterator[RdfObject]:
 def _enumerate_container(
     bnode: RdfBlanknode,
 ) -> Iterator[tuple[int, RdfObject]]:
-    _INDEX_NAMESPACE = IriNamespace(RDF['_'])  # rdf:_1, rdf:_2, ...
     for _pred, _obj in bnode:
-        try:
-            _index = int(iri_minus_namespace(
-                _pred,
-                namespace=_INDEX_NAMESPACE,
-            ))
-        except ValueError:
-            pass
-        else:
-            yield (_index, _obj)
+        if _pred.startswith(_CONTAINER_INDEX_PREFIX):
+            try:
+                _index = int(_pred[_CONTAINER_INDEX_PREFIX_LEN:])
+            except ValueError:
+                pass
+            else:
+                yield (_index, _obj)
 
 
 ###
@@ -688,8 +724,31 @@ class IriNamespace:
         '''IriNamespace.__getattr__: build iri with `DOT.dot` syntax
 
         convenience for names that happen to fit python's attrname constraints
+
+        each name is joined once, then kept as an instance attribute (so
+        `__getattr__` is not called again for that name)
+        >>> _ns = IriNamespace('https://ns.example/')
+        >>> _ns.foo
+        'https://ns.example/foo'
+        >>> vars(_ns)['foo']
+        'https://ns.example/foo'
+
+        dunder names are python protocol probes, not vocabulary terms
+        >>> _ns.__wrapped__
+        Traceback (most recent call last):
+          ...
+        AttributeError: __wrapped__
+        >>> '__wrapped__' in vars(_ns)
+        False
         '''
-        return self.__join_name(attrname)
+        if attrname.startswith('__') and attrname.endswith('__'):
+            raise AttributeError(attrname)
+        # attrnames are vocabulary terms written in code (unlike names given
+        # to `__getitem__`, which may be any data), so worth interning
+        _iri = self.__dict__[attrname] = sys.intern(
+            self.__join_name(attrname),
+        )
+        return _iri
 
     def __contains__(self, iri_or_namespace):
         iri = (
@@ -755,6 +814,27 @@ RDFS = IriNamespace('http://www.w3.org/2000/01/rdf-schema#')
 OWL = IriNamespace('http://www.w3.org/2002/07/owl#')
 XSD = IriNamespace('http://www.w3.org/2001/XMLSchema#')
 
+# container membership properties: rdf:_1, rdf:_2, ...
+_CONTAINER_INDEX_PREFIX = RDF['_']
+_CONTAINER_INDEX_PREFIX_LEN = len(_CONTAINER_INDEX_PREFIX)
+# (and the type twoples that make a blank node a container)
+_CONTAINER_TYPE_TWOPLES = frozenset(
+    (RDF.type, _container_type)
+    for _container_type in (RDF.Seq, RDF.Bag, RDF.Alt, RDF.Container)
+)
+
+# datatype_iris for literals with only an implied datatype (see `literal`)
+_IMPLIED_DATATYPE_IRIS = {
+    _datatype_iri: frozenset((_datatype_iri,))
+    for _datatype_iri in (
+        RDF.string,
+        XSD.integer,
+        XSD.float,
+        XSD.date,
+        XSD.dateTime,
+    )
+}
+
 # in this implementation, `Literal` can have many
 # datatype iris, which includes languages by iri:
 # here is a probably-reliable way to express IETF
@@ -780,6 +860,10 @@ IANA_LANGUAGE = IriNamespace(
     ),
 )
 
+# for finding language tags among a literal's datatype iris
+_IANA_LANGUAGE_IRI = get_namespace_iri(IANA_LANGUAGE)
+_IANA_LANGUAGE_IRI_LEN = len(_IANA_LANGUAGE_IRI)
+
 # another IANA-based probably-reliable namespace:
 IANA_MEDIATYPE = IriNamespace(
     'https://www.iana.org/assignments/media-types/',
@@ -850,13 +934,55 @@ ShorthandPrefixMap = dict[str, Union[str, IriNamespace]]
 
 class IriShorthand:
     delimiter = ':'
+    _cache_maxsize = 1024  # per cache (compact, expand), per instance
     __used_shorts = None  # for track_used_shorts
 
     def __init__(self, prefix_map: Optional[ShorthandPrefixMap] = None):
-        self.prefix_map = {**(prefix_map or {})}  # make a copy; handle None
+        self.prefix_map = prefix_map or {}
 
     def __repr__(self):
-        return f'{self.__class__.__qualname__}({self.prefix_map})'
+        return f'{self.__class__.__qualname__}({self._prefix_map})'
+
+    @property
+    def prefix_map(self) -> ShorthandPrefixMap:
+        '''read-only view of the prefix map (assign a new one to change it)
+
+        >>> _shorthand = IriShorthand({'blarg': BLARG})
+        >>> _shorthand.prefix_map['lol'] = BLARG.haha
+        Traceback (most recent call last):
+          ...
+        TypeError: 'mappingproxy' object does not support item assignment
+        '''
+        return types.MappingProxyType(self._prefix_map)
+
+    @prefix_map.setter
+    def prefix_map(self, prefix_map: ShorthandPrefixMap):
+        self._prefix_map = {**prefix_map}  # make a copy
+        # same prefix map, but with each long prefix as a plain str
+        self._str_prefix_map: dict[str, str] = {
+            _short: (
+                get_namespace_iri(_long)
+                if isinstance(_long, IriNamespace)
+                else _long
+            )
+            for _short, _long in self._prefix_map.items()
+        }
+        self._prefix_pairs = tuple(self._str_prefix_map.items())
+        # compact_iri/expand_iri results (each with the short prefix used),
+        # keyed by (delimiter, iri) -- new dicts, not cleared ones, so a
+        # copy that shared the old ones keeps them
+        self._compact_cache: dict[
+            tuple[str, str], tuple[str, Optional[str]]
+        ] = {}
+        self._expand_cache: dict[
+            tuple[str, str], tuple[str, Optional[str]]
+        ] = {}
+
+    def __cache_result(self, cache: dict, key, result):
+        if len(cache) >= self._cache_maxsize:
+            del cache[next(iter(cache))]  # forget the oldest
+        cache[key] = result
+        return result
 
     def with_update(
         self,
@@ -871,7 +997,7 @@ class IriShorthand:
         IriShorthand({'foo': 'urn:foo:', 'qux': 'urn:qux:'})
         '''
         _updated_prefix_map = {
-            **self.prefix_map,
+            **self._prefix_map,
             **another_prefix_map,
         }
         return IriShorthand({
@@ -895,7 +1021,7 @@ class IriShorthand:
         >>> _shorthand = IriShorthand({'blarg': BLARG})
         >>> _shorthand.compact_iri(BLARG.haha)
         'blarg:haha'
-        >>> _shorthand.prefix_map['lol'] = BLARG.haha
+        >>> _shorthand.prefix_map = {'blarg': BLARG, 'lol': BLARG.haha}
         >>> _shorthand.compact_iri(BLARG.haha)
         'lol'
         >>> _shorthand.delimiter = '--'
@@ -907,15 +1033,37 @@ class IriShorthand:
         >>> IriShorthand({}).compact_iri(BLARG.haha)
         'http://blarg.example/vocab/haha'
         '''
-        _matches = set(self._iter_shortenings(iri))
-        if not _matches:
-            return iri  # no shortening
-        # if multiple ways to shorten, use the shortest compact iri
-        _matchdict = dict(_matches)
-        _compact_iri = choose_one_iri(_matchdict.keys())
-        self.__used_short(_matchdict[_compact_iri])
+        _key = (self.delimiter, iri)
+        try:
+            _compact_iri, _used_short = self._compact_cache[_key]
+        except KeyError:
+            _compact_iri, _used_short = self.__cache_result(
+                self._compact_cache, _key, self._compute_compact_iri(iri),
+            )
+        if _used_short is not None:
+            self.__used_short(_used_short)
         return _compact_iri
 
+    def _compute_compact_iri(self, iri: str) -> tuple[str, Optional[str]]:
+        # if multiple ways to shorten, use the shortest compact iri (same
+        # preference as `choose_one_iri`) -- a longer prefix need not give
+        # a shorter compact iri, so every prefix is checked, in one pass
+        _best: tuple[str, Optional[str]] = (iri, None)  # no shortening
+        _best_key = None
+        for _short, _long in self._prefix_pairs:
+            if iri.startswith(_long):
+                _name = iri[len(_long):]
+                _compact_iri = (
+                    f'{_short}{self.delimiter}{_name}'
+                    if _name
+                    else _short
+                )
+                _key = (':' in _compact_iri, len(_compact_iri), _compact_iri)
+                if (_best_key is None) or (_key < _best_key):
+                    _best = (_compact_iri, _short)
+                    _best_key = _key
+        return _best
+
     def expand_iri(self, iri: str) -> str:
         '''return the expanded form of the given iri (or the iri unchanged)
 
@@ -932,28 +1080,49 @@ class IriShorthand:
         'http://something.example/else'
         >>> IriShorthand({'http': BLARG}).expand_iri('http://foo.example')
         'http://foo.example'
+        >>> class _DashShorthand(IriShorthand):
+        ...     delimiter = '--'
+        >>> _dashed = _DashShorthand({'blarg': BLARG})
+        >>> _dashed.compact_iri(BLARG.foo)
+        'blarg--foo'
+        >>> _dashed.expand_iri('blarg--foo')
+        'http://blarg.example/vocab/foo'
+        >>> _dashed.delimiter = '::'
+        >>> _dashed.compact_iri(BLARG.foo)
+        'blarg::foo'
+        >>> import copy
+        >>> _copied = copy.copy(_dashed)
+        >>> _copied.prefix_map = {'b': BLARG}
+        >>> (_copied.compact_iri(BLARG.foo), _dashed.compact_iri(BLARG.foo))
+        ('b::foo', 'blarg::foo')
         '''
+        _key = (self.delimiter, iri)
+        try:
+            _expanded_iri, _used_short = self._expand_cache[_key]
+        except KeyError:
+            _expanded_iri, _used_short = self.__cache_result(
+                self._expand_cache, _key, self._compute_expanded_iri(iri),
+            )
+        if _used_short is not None:
+            self.__used_short(_used_short)
+        return _expanded_iri
+
+    def _compute_expanded_iri(self, iri: str) -> tuple[str, Optional[str]]:
         try:
-            _exact_match = self.prefix_map[iri]
+            _exact_match = self._str_prefix_map[iri]
         except KeyError:
             pass
         else:  # found exact match
-            self.__used_short(iri)
-            return (
-                str(_exact_match)
-                if isinstance(_exact_match, IriNamespace)
-                else _exact_match
-            )
+            return (_exact_match, iri)
         _short_prefix, _delimiter, _remainder = iri.partition(self.delimiter)
         if _delimiter and not _remainder.startswith('//'):
             try:
-                _long_prefix = self.prefix_map[_short_prefix]
+                _long_prefix = self._str_prefix_map[_short_prefix]
             except KeyError:
                 pass
             else:
-                self.__used_short(_short_prefix)
-                return f'{_long_prefix}{_remainder}'
-        return iri  # not a recognized shorthand
+                return (f'{_long_prefix}{_remainder}', _short_prefix)
+        return (iri, None)  # not a recognized shorthand
 
     def expand_triple(self, triple):
         (_subj, _pred, _obj) = triple
@@ -973,20 +1142,6 @@ class IriShorthand:
             )
         return term
 
-    def _iter_shortenings(self, iri):
-        for _short, _long in self.prefix_map.items():
-            _is_match = (
-                (iri in _long)
-                if isinstance(_long, IriNamespace)
-                else iri.startswith(_long)
-            )
-            if _is_match:
-                _name = iri_minus_namespace(iri, namespace=_long)
-                if _name:
-                    yield (f'{_short}{self.delimiter}{_name}', _short)
-                else:
-                    yield (_short, _short)
-
     def __used_short(self, short_prefix):
         if self.__used_shorts is not None:
             self.__used_shorts.add(short_prefix)
@@ -1022,10 +1177,14 @@ class RdfGraph:
     True
     '''
     tripledict: RdfTripleDictionary
+    # optional predicate-object-subject index (see `subjects_with`)
+    _pos_index: Optional[dict[RdfPredicate, dict[RdfObject, set[str]]]]
 
     def __init__(
         self,
         triples: Union[RdfTripleDictionary, Iterable[RdfTriple], None] = None,
+        *,
+        build_pos_index: bool = False,
     ):
         if triples is None:
             self.tripledict = {}
@@ -1036,9 +1195,16 @@ class RdfGraph:
             self.tripledict = triples  # type: ignore[assignment]
         else:  # assume Iterable[RdfTriple]
             self.tripledict = tripledict_from_tripleset(triples)
+        self._pos_index = None
+        if build_pos_index:
+            self._pos_index = {}
+            for _triple in iter_tripleset(self.tripledict):
+                self._pos_index_add(_triple)
 
     def add(self, triple: RdfTriple):
         add_triple(self.tripledict, triple)
+        if self._pos_index is not None:
+            self._pos_index_add(triple)
 
     def remove(self, triple: RdfTriple):
         '''remove a triple from the graph
@@ -1068,6 +1234,8 @@ class RdfGraph:
                     del self.tripledict[_subj]
         except KeyError:
             raise KeyError(triple)
+        if self._pos_index is not None:
+            self._pos_index_remove(triple)
 
     def discard(self, triple: RdfTriple):
         '''
@@ -1079,12 +1247,113 @@ class RdfGraph:
             pass
 
     def add_twopledict(self, subject: str, twopledict: RdfTwopleDictionary):
-        for _pred, _obj in iter_twoples(twopledict):
-            self.add((subject, _pred, _obj))
+        '''add all twoples from the given twopledict to the given subject
+
+        >>> _mygraph = RdfGraph({':a': {':nums': {1}}})
+        >>> _mygraph.add_twopledict(':a', {':nums': {2, 3}, ':no': set()})
+        >>> _mygraph.tripledict
+        {':a': {':nums': {1, 2, 3}}}
+        '''
+        _own_twopledict = None
+        for _pred, _objectset in twopledict.items():
+            if not _objectset:
+                continue
+            if _own_twopledict is None:
+                _own_twopledict = self.tripledict.setdefault(subject, {})
+            _own_objectset = _own_twopledict.get(_pred)
+            if _own_objectset is None:
+                _own_twopledict[_pred] = set(_objectset)
+            else:
+                _own_objectset.update(_objectset)
+            if self._pos_index is not None:
+                for _obj in _objectset:
+                    self._pos_index_add((subject, _pred, _obj))
+
+    def extend(self, triples: Iterable[RdfTriple]):
+        '''add many triples (like calling `add` for each, but quicker)
+
+        >>> _mygraph = RdfGraph({':a': {':nums': {1}}})
+        >>> _mygraph.extend([(':a', ':nums', 2), (':b', ':nums', 3)])
+        >>> _mygraph.tripledict
+        {':a': {':nums': {1, 2}}, ':b': {':nums': {3}}}
+        '''
+        # bind lookups to locals once, for the sake of large batches
+        _tripledict = self.tripledict
+        _get_twopledict = _tripledict.get
+        _pos_index_add = (
+            self._pos_index_add
+            if self._pos_index is not None
+            else None
+        )
+        for (_subj, _pred, _obj) in triples:
+            _twopledict = _get_twopledict(_subj)
+            if _twopledict is None:
+                _twopledict = _tripledict[_subj] = {}
+            _objectset = _twopledict.get(_pred)
+            if _objectset is None:
+                _objectset = _twopledict[_pred] = set()
+            _objectset.add(_obj)
+            if _pos_index_add is not None:
+                _pos_index_add((_subj, _pred, _obj))
 
     def add_tripledict(self, tripledict: RdfTripleDictionary):
-        for _triple in iter_tripleset(tripledict):
-            self.add(_triple)
+        self.extend(iter_tripleset(tripledict))
+
+    def subjects_with(self, predicate: str, obj: RdfObject) -> frozenset[str]:
+        '''get the subjects of all triples with the given predicate and object
+
+        >>> _graph = RdfGraph({
+        ...     ':a': {RDF.type: {':Thing'}},
+        ...     ':b': {RDF.type: {':Thing', ':Other'}},
+        ... })
+        >>> sorted(_graph.subjects_with(RDF.type, ':Thing'))
+        [':a', ':b']
+
+        with `build_pos_index=True`, answers from an index (instead of
+        visiting every subject) -- the index is kept up to date by `add`,
+        `extend`, `remove`, `discard`, `add_twopledict`, and `add_tripledict`
+        (but not by changes made to the wrapped tripledict some other way)
+        >>> _indexed = RdfGraph(_graph.tripledict, build_pos_index=True)
+        >>> sorted(_indexed.subjects_with(RDF.type, ':Thing'))
+        [':a', ':b']
+        >>> _indexed.remove((':a', RDF.type, ':Thing'))
+        >>> _indexed.add((':c', RDF.type, ':Other'))
+        >>> sorted(_indexed.subjects_with(RDF.type, ':Thing'))
+        [':b']
+        >>> sorted(_indexed.subjects_with(RDF.type, ':Other'))
+        [':b', ':c']
+        >>> _indexed.subjects_with(':nope', ':nope')
+        frozenset()
+        '''
+        if self._pos_index is not None:
+            try:
+                return frozenset(self._pos_index[predicate][obj])
+            except KeyError:
+                return _EMPTY_FROZENSET
+        return frozenset(
+            _subj
+            for _subj, _twopledict in self.tripledict.items()
+            if obj in _twopledict.get(predicate, ())
+        )
+
+    def _pos_index_add(self, triple: RdfTriple):
+        (_subj, _pred, _obj) = triple
+        (
+            self._pos_index  # type: ignore[union-attr]
+            .setdefault(_pred, {})
+            .setdefault(_obj, set())
+            .add(_subj)
+        )
+
+    def _pos_index_remove(self, triple: RdfTriple):
+        (_subj, _pred, _obj) = triple
+        _subjects_by_obj = self._pos_index[_pred]  # type: ignore[index]
+        _subjects = _subjects_by_obj[_obj]
+        _subjects.discard(_subj)
+        if not _subjects:
+            del _subjects_by_obj[_obj]
+            if not _subjects_by_obj:
+                del self._pos_index[_pred]  # type: ignore[index]
 
     def __contains__(self, triple: RdfTriple) -> bool:
         (_subj, _pred, _obj) = triple
@@ -1118,12 +1387,75 @@ class RdfGraph:
         >>> sorted(_tw.q(':a', {':blorg': {':blorg': ':blorg'}}))
         [':b', ':c']
         '''
-        return self._iter_twopledict_objects(
+        if not isinstance(pathset, (dict, list, set)):
+            try:  # hashable pathsets (like a lone predicate) compile once
+                _compiled = _compile_hashable_pathset(pathset)
+            except TypeError:  # unhashable after all
+                pass
+            else:  # only a dict nests, so these are one step deep
+                return self._iter_one_step_objects(
+                    self.tripledict.get(subj) or {},
+                    _compiled,
+                )
+        # unhashable (like a dict) -- walk it tidied, which costs less than
+        # compiling it for a single use
+        return self._iter_tidy_pathset_objects(
             self.tripledict.get(subj) or {},
             tidy_pathset(pathset),
         )
 
-    def _iter_twopledict_objects(
+    def q_compiled(
+        self,
+        subj: str,
+        compiled_pathset: CompiledPathset,
+    ) -> Iterator[RdfObject]:
+        '''like `q`, but with a pathset already compiled by `compile_pathset`
+
+        (for the same query from many subjects, compile the pathset once)
+        >>> _tw = RdfGraph({':a': {':b': {':c'}}, ':c': {':d': {7}}})
+        >>> _compiled = compile_pathset({':b': ':d'})
+        >>> list(_tw.q_compiled(':a', _compiled))
+        [7]
+
+        a subject reached by more than one path is walked once, but still
+        counts once per path
+        >>> _diamond = RdfGraph({
+        ...     ':a': {':to': {':b', ':c'}},
+        ...     ':b': {':to': {':d'}},
+        ...     ':c': {':to': {':d'}},
+        ...     ':d': {':nums': {1}},
+        ... })
+        >>> _to_to_nums = compile_pathset({':to': {':to': ':nums'}})
+        >>> list(_diamond.q_compiled(':a', _to_to_nums))
+        [1, 1]
+
+        (likewise a blank node reached by more than one path)
+        >>> _bnode = frozenset([(':nums', 1)])
+        >>> _bnode_diamond = RdfGraph({
+        ...     ':a': {':to': {':b', ':c'}},
+        ...     ':b': {':to': {_bnode}},
+        ...     ':c': {':to': {_bnode}},
+        ... })
+        >>> list(_bnode_diamond.q_compiled(':a', _to_to_nums))
+        [1, 1]
+        '''
+        # memos for this query only (the graph may change after)
+        return self._iter_twopledict_objects(
+            self.tripledict.get(subj) or {},
+            compiled_pathset,
+            {},
+            {},
+        )
+
+    def _iter_one_step_objects(
+        self,
+        twopledict: RdfTwopleDictionary,
+        compiled_pathset: CompiledPathset,
+    ) -> Iterator[RdfObject]:
+        for _pred, _ in compiled_pathset:
+            yield from twopledict.get(_pred) or ()
+
+    def _iter_tidy_pathset_objects(
         self,
         twopledict: RdfTwopleDictionary,
         tidy_pathset: TidyPathset,
@@ -1140,11 +1472,59 @@ class RdfGraph:
                         _next_twopledict = twopledict_from_twopleset(_obj)
                     else:
                         continue
-                    yield from self._iter_twopledict_objects(
+                    yield from self._iter_tidy_pathset_objects(
                         _next_twopledict,
                         _next_pathset,
                     )
 
+    def _iter_twopledict_objects(
+        self,
+        twopledict: ReadonlyTwopleDictionary,
+        compiled_pathset: CompiledPathset,
+        memo: dict[tuple[str, int], tuple[RdfObject, ...]],
+        bnode_memo: dict[int, tuple[RdfBlanknode, RdfTwopleDictionary]],
+    ) -> Iterator[RdfObject]:
+        for _pred, _next_pathset in compiled_pathset:
+            _object_set = twopledict.get(_pred) or ()
+            if not _next_pathset:  # end of path
+                yield from _object_set
+            else:  # more path
+                for _obj in _object_set:
+                    if isinstance(_obj, str):
+                        # subjects reached by several paths are walked once
+                        # per remaining pathset (results kept as a tuple,
+                        # since `q` yields duplicates)
+                        _memokey = (_obj, id(_next_pathset))
+                        try:
+                            _found = memo[_memokey]
+                        except KeyError:
+                            _found = memo[_memokey] = tuple(
+                                self._iter_twopledict_objects(
+                                    self.tripledict.get(_obj) or {},
+                                    _next_pathset,
+                                    memo,
+                                    bnode_memo,
+                                )
+                            )
+                        yield from _found
+                    elif isinstance(_obj, frozenset):
+                        # index each blank node (by identity, not equality:
+                        # equal blank nodes may hold 1 and 1.0) once per
+                        # query, holding it so its id stays unique
+                        try:
+                            _, _bnode_twopledict = bnode_memo[id(_obj)]
+                        except KeyError:
+                            _bnode_twopledict = twopledict_from_twopleset(
+                                _obj,
+                            )
+                            bnode_memo[id(_obj)] = (_obj, _bnode_twopledict)
+                        yield from self._iter_twopledict_objects(
+                            _bnode_twopledict,
+                            _next_pathset,
+                            memo,
+                            bnode_memo,
+                        )
+
 
 class QuotedGraph(RdfGraph):
     focus_iri: str
@@ -1154,6 +1534,17 @@ class QuotedGraph(RdfGraph):
         super().__init__(*args, **kwargs)
 
 
+# rdf object types (other than iri and blank node) for `smells_like_rdf_object`
+_NONIRI_RDF_OBJECT_TYPES = (
+    int,
+    float,
+    datetime.date,
+    Literal,
+    QuotedTriple,
+    QuotedGraph,
+)
+
+
 def tidy_pathset(messy_pathset: MessyPathset) -> TidyPathset:
     if not messy_pathset:
         return {}
@@ -1181,6 +1572,36 @@ def tidy_pathset(messy_pathset: MessyPathset) -> TidyPathset:
     return _pathset
 
 
+def compile_pathset(messy_pathset: MessyPathset) -> CompiledPathset:
+    '''tidy the given pathset into immutable nested tuples
+
+    >>> compile_pathset(':a')
+    ((':a', ()),)
+    >>> compile_pathset({':a': [':b', ':c'], ':d': None})
+    ((':a', ((':b', ()), (':c', ()))), (':d', ()))
+
+    hashable pathsets (like a lone predicate) are compiled only once
+    >>> compile_pathset(':a') is compile_pathset(':a')
+    True
+    '''
+    try:
+        return _compile_hashable_pathset(messy_pathset)
+    except TypeError:  # unhashable (e.g. a dict); compile without caching
+        return _compile_tidy_pathset(tidy_pathset(messy_pathset))
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_hashable_pathset(messy_pathset: MessyPathset) -> CompiledPathset:
+    return _compile_tidy_pathset(tidy_pathset(messy_pathset))
+
+
+def _compile_tidy_pathset(tidy_pathset: TidyPathset) -> CompiledPathset:
+    return tuple(
+        (_pred, _compile_tidy_pathset(_next_pathset))
+        for _pred, _next_pathset in tidy_pathset.items()
+    )
+
+
 ###
 # no-context json-ld serialization
 